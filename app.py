@@ -17,19 +17,27 @@ import re
 import json
 import time
 import csv
+import hashlib
 import secrets
+import threading
 import unicodedata
 from html import escape
 from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta, timezone
 from io import BytesIO, StringIO
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
+from types import MappingProxyType
 from urllib.parse import urljoin, urlparse
 from itsdangerous import BadSignature, SignatureExpired, URLSafeSerializer, URLSafeTimedSerializer
 from dotenv import load_dotenv
+import orjson
 import requests
-from flask import Flask, request, jsonify, redirect, send_file, send_from_directory, Response, session, url_for
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, current_app, request, jsonify, redirect, send_file, send_from_directory, Response, session, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from eures_beta_email_templates import (
     get_candidate_invitation_template,
@@ -42,8 +50,51 @@ BASE_DIR = Path(__file__).parent
 FORMS_DIR = BASE_DIR / 'forms'
 ASSETS_DIR = BASE_DIR / 'assets'
 DOCS_DIR = BASE_DIR / 'docs'
+# Asset file names are not content-hashed: keep browser caching short and rely on ETag revalidation.
+STATIC_ASSETS_MAX_AGE_SECONDS = 3600
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, for jsonify() and request.get_json().
+
+    Keeps Flask's output conventions (sorted keys, HTTP dates, UUID/Decimal/
+    dataclass support through DefaultJSONProvider.default). The stdlib
+    provider takes over for values orjson cannot encode (integers above
+    64 bits), for documents containing 19+ digit numbers (which orjson would
+    decode as floats) and for indented output in debug mode.
+    """
+
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    _long_digits_text = re.compile(r'[0-9]{19,}')
+    _long_digits_bytes = re.compile(rb'[0-9]{19,}')
+
+    def _dumps_bytes(self, obj, option: int = 0) -> bytes:
+        try:
+            return orjson.dumps(obj, default=self.default, option=self.options | option)
+        except orjson.JSONEncodeError:
+            return (super().dumps(obj, separators=(',', ':')) + ('\n' if option & orjson.OPT_APPEND_NEWLINE else '')).encode()
+
+    def dumps(self, obj, **kwargs) -> str:
+        if set(kwargs) - {'separators'}:
+            return super().dumps(obj, **kwargs)
+        return self._dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        long_digits = self._long_digits_text if isinstance(s, str) else self._long_digits_bytes
+        if kwargs or long_digits.search(s):
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        if self.compact is False or (self.compact is None and current_app.debug):
+            return super().response(*args, **kwargs)
+        if args and kwargs:
+            raise TypeError('app.json.response() takes either args or kwargs, not both')
+        obj = kwargs or (args[0] if len(args) == 1 else list(args) or None)
+        return current_app.response_class(self._dumps_bytes(obj, orjson.OPT_APPEND_NEWLINE), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config.update(
     SECRET_KEY=(
         os.environ.get('SESSION_SECRET')
@@ -64,8 +115,33 @@ _ADMIN_MAGIC_LINK_USED: dict[str, float] = {}
 _EURES_PUBLIC_WRITE_ATTEMPTS: dict[tuple[str, str], list[float]] = {}
 
 GRIST_BASE_URL = os.environ.get('GRIST_BASE_URL', 'https://grist.numerique.gouv.fr').rstrip('/')
+# Shared keep-alive pool for Grist calls: avoids one TCP+TLS handshake per upstream request.
+GRIST_SESSION = requests.Session()
+_GRIST_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False),
+)
+# http:// too, for self-hosted or local Grist instances set through GRIST_BASE_URL.
+GRIST_SESSION.mount('https://', _GRIST_ADAPTER)
+GRIST_SESSION.mount('http://', _GRIST_ADAPTER)
+GRIST_SESSION.headers.update({'Accept': 'application/json'})
+# Runs independent Grist reads of one request concurrently (GRIST_SESSION is shared across threads).
+_GRIST_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix='grist')
 _TABLE_COLUMNS_CACHE: dict[tuple[str, str], dict[str, object]] = {}
 _TABLE_COLUMNS_CACHE_TTL_SECONDS = 60
+_RECORDS_CACHE: dict[tuple[str, str], dict[str, object]] = {}
+_RECORDS_CACHE_TTL_SECONDS = 5
+_RECORDS_CACHE_LOCK = threading.Lock()
+# Filtered reads (duplicate checks) keyed by (doc_id, table_id, query); same TTL and lock.
+_QUERY_CACHE: dict[tuple[str, str, tuple], tuple[float, list]] = {}
+_QUERY_CACHE_MAXSIZE = 256
+# Loads currently running for a cache key; concurrent misses wait on the same Future.
+_INFLIGHT_LOADS: dict[tuple, Future] = {}
+_INFLIGHT_WAIT_SECONDS = 30
+# (connect, read) timeout for the shared table reads; with the adapter's two
+# retries a hung call still gives up before _INFLIGHT_WAIT_SECONDS.
+_GRIST_READ_TIMEOUT = (3, 6)
 EURES_CANDIDATS_TABLE = 'Candidats'
 EURES_BESOINS_TABLE = 'Besoins_Employeurs'
 EURES_MATCHINGS_TABLE = 'Matchings'
@@ -849,8 +925,13 @@ def admin_required(fn):
     return wrapper
 
 
-def get_form_config(form_id: str, role: str | None = None) -> dict:
-    """Get configuration for a form from environment variables."""
+@lru_cache(maxsize=64)
+def get_form_config(form_id: str, role: str | None = None) -> MappingProxyType | None:
+    """Get configuration for a form from environment variables.
+
+    Environment variables do not change after startup, so the result is cached
+    per (form_id, role) and returned read-only to keep the shared value intact.
+    """
     form_id_upper = form_id.replace('-', '_').upper()
     role_upper = (role or '').strip().replace('-', '_').upper()
 
@@ -865,15 +946,27 @@ def get_form_config(form_id: str, role: str | None = None) -> dict:
     if not doc_id:
         return None
 
-    return {
+    return MappingProxyType({
         'doc_id': doc_id,
         'table_id': _env_with_role('GRIST_TABLE') or 'Reponses',
         'api_key': _env_with_role('GRIST_API_KEY') or os.environ.get('GRIST_API_KEY'),
-    }
+    })
+
+
+@lru_cache(maxsize=32)
+def grist_headers(api_key: str | None, write: bool = False) -> MappingProxyType:
+    """Read-only Grist request headers for one API key, built once per key."""
+    headers = {'Accept': 'application/json'}
+    if write:
+        headers['Content-Type'] = 'application/json'
+    if api_key:
+        headers['Authorization'] = f'Bearer {api_key}'
+    return MappingProxyType(headers)
 
 
-def get_form_access_settings(form_id: str) -> dict:
-    """Return public access settings for one form."""
+@lru_cache(maxsize=64)
+def get_form_access_settings(form_id: str) -> MappingProxyType:
+    """Return public access settings for one form (cached, read-only)."""
     form_id_upper = form_id.replace('-', '_').upper()
     read_only_env = os.environ.get(f'FORM_READONLY_{form_id_upper}')
     default_read_only = form_id == 'fagerh'
@@ -890,47 +983,50 @@ def get_form_access_settings(form_id: str) -> dict:
         or default_message
     ).strip() or default_message
 
-    return {
+    return MappingProxyType({
         'read_only': read_only,
         'message': message,
-    }
+    })
 
 
-def get_eures_stats_config() -> dict | None:
+@lru_cache(maxsize=1)
+def get_eures_stats_config() -> MappingProxyType | None:
     """Get configuration for the optional EURES monthly stats table."""
     base = get_form_config('eures-beta', 'candidate') or get_form_config('eures-beta')
     if not base:
         return None
 
-    return {
+    return MappingProxyType({
         'doc_id': base['doc_id'],
         'table_id': os.environ.get('GRIST_TABLE_EURES_BETA_STATS', EURES_STATS_TABLE_DEFAULT),
         'api_key': base.get('api_key'),
-    }
+    })
 
 
-def get_eures_matching_config() -> dict | None:
+@lru_cache(maxsize=1)
+def get_eures_matching_config() -> MappingProxyType | None:
     """Get configuration for EURES beta matching tables."""
     base = get_form_config('eures-beta', 'candidate') or get_form_config('eures-beta')
     if not base:
         return None
-    return {
+    return MappingProxyType({
         'doc_id': base['doc_id'],
         'table_id': EURES_MATCHINGS_TABLE,
         'api_key': base.get('api_key'),
-    }
+    })
 
 
-def get_eures_invitations_config() -> dict | None:
+@lru_cache(maxsize=1)
+def get_eures_invitations_config() -> MappingProxyType | None:
     """Get configuration for the optional EURES invitations table."""
     base = get_form_config('eures-beta', 'candidate') or get_form_config('eures-beta')
     if not base:
         return None
-    return {
+    return MappingProxyType({
         'doc_id': base['doc_id'],
         'table_id': os.environ.get('GRIST_TABLE_EURES_BETA_INVITATIONS', EURES_INVITATIONS_TABLE_DEFAULT),
         'api_key': base.get('api_key'),
-    }
+    })
 
 
 def get_brevo_config() -> dict:
@@ -1433,8 +1529,8 @@ def _normalize_eures_invitation_target_job_keys(value) -> list[str]:
             candidates = []
         else:
             try:
-                parsed = json.loads(stripped)
-            except Exception:
+                parsed = orjson.loads(stripped)
+            except orjson.JSONDecodeError:
                 parsed = None
             if isinstance(parsed, list):
                 candidates = parsed
@@ -2301,10 +2397,10 @@ def get_table_columns(config: dict, headers: dict) -> set[str]:
         return set(cached.get('columns', set()))
 
     url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}/columns"
-    resp = requests.get(url, headers=headers)
+    resp = GRIST_SESSION.get(url, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f'Failed to read table columns: HTTP {resp.status_code} - {resp.text}')
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     columns = set()
     for col in payload.get('columns', []):
         col_id = (col or {}).get('id')
@@ -2337,7 +2433,7 @@ def ensure_table_columns(config: dict, columns: set[str], headers: dict):
             for column_id in missing
         ]
     }
-    resp = requests.post(url, json=payload, headers=headers)
+    resp = GRIST_SESSION.post(url, json=payload, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f'Failed to create columns in {config["table_id"]}: HTTP {resp.status_code} - {resp.text}')
 
@@ -2369,8 +2465,8 @@ def _safe_json(value, fallback):
         if not txt:
             return fallback
         try:
-            return json.loads(txt)
-        except Exception:
+            return orjson.loads(txt)
+        except orjson.JSONDecodeError:
             return fallback
     return value if value is not None else fallback
 
@@ -2836,20 +2932,135 @@ def compute_quick_step_progress(fields: dict) -> dict:
     }
 
 
+def _records_cache_key(config: dict) -> tuple[str, str]:
+    return (str(config.get('doc_id') or ''), str(config.get('table_id') or ''))
+
+
+def _single_flight(key: tuple, load):
+    """Run load once for concurrent callers sharing key; the others wait for its result."""
+    with _RECORDS_CACHE_LOCK:
+        future = _INFLIGHT_LOADS.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT_LOADS[key] = Future()
+    if not leader:
+        try:
+            return future.result(timeout=_INFLIGHT_WAIT_SECONDS)
+        except FutureTimeoutError:
+            # The leader is stuck; do not fail this request on its behalf.
+            return load()
+
+    try:
+        result = load()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _RECORDS_CACHE_LOCK:
+            _INFLIGHT_LOADS.pop(key, None)
+    future.set_result(result)
+    return result
+
+
+def fetch_doc_state(config: dict, headers: dict) -> str | None:
+    """Return the hash of the document's latest action, or None when unavailable.
+
+    Any change to the document moves this hash, which makes it a cheap
+    validator for cached table reads (Grist sends no ETag on /records).
+    """
+    url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/states"
+    try:
+        resp = GRIST_SESSION.get(url, headers=headers, timeout=_GRIST_READ_TIMEOUT)
+        if resp.status_code != 200:
+            return None
+        states = orjson.loads(resp.content).get('states') or []
+        return str(states[0].get('h') or '') or None
+    except (requests.RequestException, orjson.JSONDecodeError, AttributeError, IndexError):
+        return None
+
+
+def _get_records_cache_entry(config: dict, headers: dict) -> dict:
+    """Return the cached full-table read, refreshing it once the short TTL expires.
+
+    An expired entry is kept (with its indexes) when the document state hash
+    has not moved since it was loaded; otherwise the table is read again.
+    Cold loads skip the state request: there is nothing to validate yet, so
+    the state is only recorded from the first refresh onwards.
+    """
+    cache_key = _records_cache_key(config)
+    with _RECORDS_CACHE_LOCK:
+        cached = _RECORDS_CACHE.get(cache_key)
+    if cached and (time.monotonic() - float(cached.get('loaded_at', 0))) < _RECORDS_CACHE_TTL_SECONDS:
+        return cached
+
+    def _load():
+        now = time.monotonic()
+        doc_state = fetch_doc_state(config, headers) if cached else None
+        if doc_state and cached.get('doc_state') == doc_state:
+            with _RECORDS_CACHE_LOCK:
+                if _RECORDS_CACHE.get(cache_key) is cached:
+                    cached['loaded_at'] = now
+                    return cached
+
+        url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}/records"
+        resp = GRIST_SESSION.get(url, params={'limit': 5000}, headers=headers, timeout=_GRIST_READ_TIMEOUT)
+        if resp.status_code != 200:
+            raise RuntimeError(f'Failed to read records: HTTP {resp.status_code} - {resp.text}')
+        payload = orjson.loads(resp.content)
+        entry = {
+            'records': payload.get('records', []),
+            'loaded_at': now,
+            'doc_state': doc_state,
+        }
+        with _RECORDS_CACHE_LOCK:
+            _RECORDS_CACHE[cache_key] = entry
+        return entry
+
+    return _single_flight(('records', *cache_key), _load)
+
+
+def invalidate_records_cache(config: dict):
+    """Drop the cached full-table and filtered reads after a write to that table."""
+    cache_key = _records_cache_key(config)
+    with _RECORDS_CACHE_LOCK:
+        _RECORDS_CACHE.pop(cache_key, None)
+        for query_key in [key for key in _QUERY_CACHE if key[:2] == cache_key]:
+            del _QUERY_CACHE[query_key]
+
+
+def fetch_cached_query(config: dict, query: tuple, load) -> list:
+    """Return records of a filtered read, reusing a result younger than the records TTL.
+
+    query identifies the request (e.g. ('filter', filter_param)); load performs
+    it and returns the records. Failed loads raise and are not cached.
+    """
+    cache_key = (*_records_cache_key(config), query)
+    now = time.monotonic()
+    with _RECORDS_CACHE_LOCK:
+        cached = _QUERY_CACHE.get(cache_key)
+    if cached and (now - cached[0]) < _RECORDS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    def _load_and_store():
+        records = load()
+        with _RECORDS_CACHE_LOCK:
+            if cache_key not in _QUERY_CACHE and len(_QUERY_CACHE) >= _QUERY_CACHE_MAXSIZE:
+                _QUERY_CACHE.pop(next(iter(_QUERY_CACHE)))
+            _QUERY_CACHE[cache_key] = (now, records)
+        return records
+
+    return _single_flight(('query', *cache_key), _load_and_store)
+
+
 def fetch_all_records(config: dict, headers: dict):
-    """Fetch records for a form table (single pass, up to 5000 rows)."""
-    url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}/records"
-    resp = requests.get(url, params={'limit': 5000}, headers=headers)
-    if resp.status_code != 200:
-        raise RuntimeError(f'Failed to read records: HTTP {resp.status_code} - {resp.text}')
-    payload = resp.json()
-    return payload.get('records', [])
+    """Fetch records for a form table (single pass, up to 5000 rows, cached a few seconds)."""
+    return _get_records_cache_entry(config, headers)['records']
 
 
 def _parse_response_json_safe(resp):
     """Return JSON payload when possible, otherwise a readable fallback dict."""
     try:
-        return resp.json()
+        return orjson.loads(resp.content)
     except Exception:
         body = (resp.text or '').strip()
         return {
@@ -2858,10 +3069,18 @@ def _parse_response_json_safe(resp):
         }
 
 
+def grist_filter(**columns) -> str:
+    """Encode a Grist records `filter` param; scalar values are wrapped in a list."""
+    return orjson.dumps({
+        column: list(values) if isinstance(values, (list, tuple, set)) else [values]
+        for column, values in columns.items()
+    }).decode()
+
+
 def fetch_record_by_field(base_url: str, field_name: str, value: str, headers: dict):
     """Fetch a single record by a unique field from Grist."""
-    filter_param = json.dumps({field_name: [value]})
-    resp = requests.get(f"{base_url}/records", params={'filter': filter_param}, headers=headers)
+    filter_param = grist_filter(**{field_name: value})
+    resp = GRIST_SESSION.get(f"{base_url}/records", params={'filter': filter_param}, headers=headers)
     if resp.status_code != 200:
         return None, resp
 
@@ -2923,7 +3142,7 @@ def write_grist_records(method: str, url: str, payload: dict, headers: dict, max
 def fetch_table_records(doc_id: str, table_id: str, headers: dict, limit: int = 5000):
     """Read records from a Grist table."""
     url = f"{GRIST_BASE_URL}/api/docs/{doc_id}/tables/{table_id}/records"
-    resp = requests.get(url, params={'limit': limit}, headers=headers)
+    resp = GRIST_SESSION.get(url, params={'limit': limit}, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f'Failed to read {table_id}: HTTP {resp.status_code} - {resp.text}')
     payload = _parse_response_json_safe(resp)
@@ -3168,13 +3387,8 @@ def build_eures_public_stats() -> dict:
     if not candidate_config or not employer_config:
         raise RuntimeError('EURES beta candidate/employer Grist configuration is incomplete.')
 
-    candidate_headers = {'Accept': 'application/json'}
-    if candidate_config.get('api_key'):
-        candidate_headers['Authorization'] = f"Bearer {candidate_config['api_key']}"
-
-    employer_headers = {'Accept': 'application/json'}
-    if employer_config.get('api_key'):
-        employer_headers['Authorization'] = f"Bearer {employer_config['api_key']}"
+    candidate_headers = grist_headers(candidate_config.get('api_key'))
+    employer_headers = grist_headers(employer_config.get('api_key'))
 
     candidats = fetch_table_records(candidate_config['doc_id'], EURES_CANDIDATS_TABLE, candidate_headers)
     besoins = fetch_table_records(employer_config['doc_id'], EURES_BESOINS_TABLE, employer_headers)
@@ -3321,9 +3535,7 @@ def build_eures_public_stats() -> dict:
     manual_stats_available = False
     stats_config = get_eures_stats_config()
     if stats_config:
-        stats_headers = {'Accept': 'application/json'}
-        if stats_config.get('api_key'):
-            stats_headers['Authorization'] = f"Bearer {stats_config['api_key']}"
+        stats_headers = grist_headers(stats_config.get('api_key'))
         try:
             manual_rows = fetch_table_records(stats_config['doc_id'], stats_config['table_id'], stats_headers)
             manual_stats_available = True
@@ -3386,8 +3598,8 @@ def build_eures_public_stats() -> dict:
 def fetch_matching_record(doc_id: str, besoin_id: str, candidat_id: str, headers: dict):
     """Read one matching by besoin_id/candidat_id pair."""
     url = f"{GRIST_BASE_URL}/api/docs/{doc_id}/tables/{EURES_MATCHINGS_TABLE}/records"
-    filter_param = json.dumps({'besoin_id': [besoin_id], 'candidat_id': [candidat_id]})
-    resp = requests.get(url, params={'filter': filter_param}, headers=headers)
+    filter_param = grist_filter(besoin_id=besoin_id, candidat_id=candidat_id)
+    resp = GRIST_SESSION.get(url, params={'filter': filter_param}, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f'Failed to read Matchings: HTTP {resp.status_code} - {resp.text}')
     payload = _parse_response_json_safe(resp)
@@ -3458,13 +3670,14 @@ def update_table_record_by_id(config: dict, record_id: int, fields: dict, header
     resp = write_grist_records('PATCH', base_url, payload, headers)
     if resp.status_code != 200:
         raise RuntimeError(f'Failed to update {config["table_id"]}: HTTP {resp.status_code} - {resp.text}')
+    invalidate_records_cache(config)
     return resp
 
 
 def fetch_record_by_id(doc_id: str, table_id: str, record_id: int, headers: dict):
     """Read one Grist record by numeric id."""
     url = f"{GRIST_BASE_URL}/api/docs/{doc_id}/tables/{table_id}/records"
-    resp = requests.get(url, params={'filter': json.dumps({'id': [record_id]})}, headers=headers)
+    resp = GRIST_SESSION.get(url, params={'filter': grist_filter(id=record_id)}, headers=headers)
     if resp.status_code != 200:
         raise RuntimeError(f'Failed to read {table_id}: HTTP {resp.status_code} - {resp.text}')
     payload = _parse_response_json_safe(resp)
@@ -3976,11 +4189,8 @@ def run_eures_matching_for_saved_record(form_id: str, role: str, saved_record: d
     }
 
 
-def _eures_admin_headers(config: dict) -> dict:
-    headers = {'Accept': 'application/json'}
-    if config.get('api_key'):
-        headers['Authorization'] = f"Bearer {config['api_key']}"
-    return headers
+def _eures_admin_headers(config: dict) -> MappingProxyType:
+    return grist_headers(config.get('api_key'))
 
 
 def _eures_admin_status(fields: dict) -> str:
@@ -4657,6 +4867,7 @@ def delete_table_record_by_id(config: dict, record_id: int, headers: dict):
     resp = write_grist_records('POST', delete_url, [int(record_id)], headers)
     if resp.status_code not in {200, 202, 204}:
         raise RuntimeError(f'Failed to delete {config["table_id"]}: HTTP {resp.status_code} - {resp.text}')
+    invalidate_records_cache(config)
     return resp
 
 
@@ -5761,15 +5972,18 @@ def build_eures_cockpit_summary() -> dict:
 
 def normalize_finess(value) -> str:
     """Normalize FINESS value for duplicate checks."""
-    raw = str(value or '').strip()
-    digits = ''.join(ch for ch in raw if ch.isdigit())
-    if digits and digits == raw:
-        return digits.zfill(9) if len(digits) == 8 else digits
+    if not value:
+        return ''
+    raw = (value if isinstance(value, str) else str(value)).strip()
+    if raw.isdigit():
+        return raw.zfill(9) if len(raw) == 8 else raw
     return raw.upper()
 
 def normalize_email(value) -> str:
     """Normalize email value for lookup."""
-    return str(value or '').strip().lower()
+    if not value:
+        return ''
+    return (value if isinstance(value, str) else str(value)).strip().lower()
 
 
 def extract_finess_values(fields: dict) -> set:
@@ -5783,14 +5997,14 @@ def extract_finess_values(fields: dict) -> set:
         values.add(main)
 
     raw_json = fields.get('finess_json')
-    parsed = []
-    if isinstance(raw_json, str) and raw_json.strip():
+    if not raw_json:
+        return values
+    parsed = raw_json
+    if isinstance(raw_json, str):
         try:
-            parsed = json.loads(raw_json)
-        except Exception:
-            parsed = []
-    elif isinstance(raw_json, list):
-        parsed = raw_json
+            parsed = orjson.loads(raw_json)
+        except orjson.JSONDecodeError:
+            return values
 
     if isinstance(parsed, list):
         for item in parsed:
@@ -5801,23 +6015,226 @@ def extract_finess_values(fields: dict) -> set:
     return values
 
 
-def find_duplicate_finess(config: dict, current_uuid: str, finess_values: set, headers: dict):
-    """Find FINESS values already used by another record in the same table."""
-    if not finess_values:
-        return set()
+def fetch_finess_index(config: dict, headers: dict) -> dict[str, set[str]]:
+    """Map each FINESS value of a table to the normalized UUIDs using it.
+
+    The index is built once per cached full-table read and reused until the
+    cache entry expires or is invalidated by a write.
+    """
+    entry = _get_records_cache_entry(config, headers)
+    index = entry.get('finess_index')
+    if index is None:
+        index = {}
+        for rec in entry['records']:
+            fields = rec.get('fields') if isinstance(rec, dict) else None
+            if not isinstance(fields, dict):
+                continue
+            rec_uuid = normalize_finess(fields.get('uuid'))
+            if fields.get('finess_json'):
+                rec_finess = extract_finess_values(fields)
+            else:
+                # Fast path: most rows only carry finess_main.
+                main = normalize_finess(fields.get('finess_main'))
+                rec_finess = (main,) if main else ()
+            for value in rec_finess:
+                owners = index.get(value)
+                if owners is None:
+                    index[value] = {rec_uuid}
+                else:
+                    owners.add(rec_uuid)
+        entry['finess_index'] = index
+    return index
+
+
+def find_cached_record(config: dict, field_name: str, value) -> dict | None:
+    """Return the record whose field matches value from a still-fresh cached read.
+
+    Returns None when the cache is cold or has no such record; callers then
+    fall back to a targeted Grist lookup.
+    """
+    with _RECORDS_CACHE_LOCK:
+        entry = _RECORDS_CACHE.get(_records_cache_key(config))
+    if not entry or (time.monotonic() - float(entry.get('loaded_at', 0))) >= _RECORDS_CACHE_TTL_SECONDS:
+        return None
+    key_indexes = entry.setdefault('key_indexes', {})
+    index = key_indexes.get(field_name)
+    if index is None:
+        index = {}
+        for rec in entry['records']:
+            fields = rec.get('fields') if isinstance(rec, dict) else None
+            if isinstance(fields, dict) and fields.get(field_name):
+                index.setdefault(str(fields[field_name]), rec)
+        key_indexes[field_name] = index
+    return index.get(str(value))
+
+
+def fetch_email_index(config: dict, headers: dict) -> dict[str, list[dict]]:
+    """Map normalized validateur_email to the records (with a uuid) using it.
+
+    Built once per cached full-table read, like the FINESS index.
+    """
+    entry = _get_records_cache_entry(config, headers)
+    index = entry.get('email_index')
+    if index is None:
+        index = {}
+        for rec in entry['records']:
+            fields = rec.get('fields') if isinstance(rec, dict) else None
+            if not isinstance(fields, dict) or not fields.get('uuid'):
+                continue
+            email = normalize_email(fields.get('validateur_email'))
+            if email:
+                index.setdefault(email, []).append(rec)
+        entry['email_index'] = index
+    return index
+
+
+def find_records_by_email_sql(config: dict, email: str, headers: dict, with_finess: bool = False) -> list[dict]:
+    """Case-insensitive validateur_email lookup through Grist's SQL endpoint.
+
+    SQLite's LOWER only folds ASCII letters, so non-ASCII characters of the
+    email become LIKE wildcards and the candidates are re-checked with
+    normalize_email, giving the same matches as the cached email index.
+    Returns records shaped like the records endpoint ({'id', 'fields'}). Raises
+    RuntimeError when the SQL endpoint refuses the query, so callers can fall
+    back to the cached email index.
+    """
+    columns = ['id', 'uuid', 'validateur_email']
+    if with_finess:
+        columns += ['finess_main', 'finess_json']
+    table_id = str(config['table_id']).replace('"', '""')
+    sql = (
+        f'SELECT {", ".join(columns)} FROM "{table_id}" '
+        f"WHERE LOWER(TRIM(validateur_email, {_SQL_WHITESPACE})) LIKE ? ESCAPE '\\' "
+        "AND uuid IS NOT NULL AND uuid != ''"
+    )
+    probe = re.sub(r'[^\x00-\x7f]+', '%', re.sub(r'([\\%_])', r'\\\1', email))
+    url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/sql"
+    resp = GRIST_SESSION.post(url, json={'sql': sql, 'args': [probe]}, headers=headers)
+    if resp.status_code != 200:
+        raise RuntimeError(f'Failed to query records: HTTP {resp.status_code} - {resp.text}')
+    payload = _parse_response_json_safe(resp)
+    rows = payload.get('records', []) if isinstance(payload, dict) else []
+    records = []
+    for row in rows:
+        fields = row.get('fields') if isinstance(row, dict) else None
+        if isinstance(fields, dict) and normalize_email(fields.get('validateur_email')) == email:
+            records.append({'id': fields.get('id'), 'fields': fields})
+    return records
+
+
+def _finess_filter_values(finess_values: set) -> list:
+    """Raw cell values a normalized FINESS may be stored as (text, unpadded, numeric)."""
+    raw_values = set()
+    for value in finess_values:
+        raw_values.add(value)
+        # isdigit() alone also accepts characters like '²' that int() rejects.
+        if value.isascii() and value.isdigit():
+            raw_values.add(int(value))
+            if len(value) == 9 and value.startswith('0'):
+                raw_values.add(value[1:])
+    return sorted(raw_values, key=str)
+
+
+def _records_cache_is_warm(config: dict) -> bool:
+    with _RECORDS_CACHE_LOCK:
+        cached = _RECORDS_CACHE.get(_records_cache_key(config))
+    return bool(cached) and (time.monotonic() - float(cached.get('loaded_at', 0))) < _RECORDS_CACHE_TTL_SECONDS
+
+
+def find_main_finess_duplicates(config: dict, current_uuid: str, finess_values: set, headers: dict) -> set:
+    """Ask Grist for rows whose finess_main collides, instead of downloading the table."""
+    url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}/records"
+    filter_param = grist_filter(finess_main=_finess_filter_values(finess_values))
+
+    def _load():
+        resp = GRIST_SESSION.get(url, params={'filter': filter_param}, headers=headers, timeout=_GRIST_READ_TIMEOUT)
+        if resp.status_code != 200:
+            raise RuntimeError(f'Failed to read records: HTTP {resp.status_code} - {resp.text}')
+        payload = _parse_response_json_safe(resp)
+        return payload.get('records', []) if isinstance(payload, dict) else []
+
+    records = fetch_cached_query(config, ('filter', filter_param), _load)
+    return _collect_finess_duplicates(records, current_uuid, finess_values)
+
+
+# Characters str.strip() removes that SQLite's TRIM() keeps by default (tab, newlines, NBSP...).
+_SQL_WHITESPACE = "' ' || char(9, 10, 11, 12, 13, 160)"
 
-    records = fetch_all_records(config, headers)
-    duplicates = set()
-    cur = normalize_finess(current_uuid)
 
+def find_finess_duplicates_sql(config: dict, current_uuid: str, finess_values: set, headers: dict) -> set:
+    """Look up finess_main and finess_json collisions in one Grist SQL round-trip.
+
+    finess_main is compared trimmed and upper-cased as text (like
+    normalize_finess) against the padded and unpadded forms of each value, so
+    integer cells and unnormalised text both match. finess_json uses
+    upper-cased LIKE probes (substrings, so surrounding spaces and quotes do
+    not matter), which can over-match, so the returned candidates are
+    re-checked with extract_finess_values. Raises RuntimeError when the SQL
+    endpoint is not usable (restricted key, missing column) so callers can
+    fall back to the records filter and the full scan.
+    """
+    probes = sorted({str(value) for value in _finess_filter_values(finess_values)})
+    table_id = str(config['table_id']).replace('"', '""')
+    where = ' OR '.join(
+        [f"UPPER(TRIM(CAST(finess_main AS TEXT), {_SQL_WHITESPACE})) IN ({', '.join('?' * len(probes))})"]
+        + ["UPPER(finess_json) LIKE '%' || ? || '%'"] * len(probes)
+    )
+    sql = f'SELECT uuid, finess_main, finess_json FROM "{table_id}" WHERE {where}'
+    args = [*probes, *probes]
+    url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/sql"
+
+    def _load():
+        resp = GRIST_SESSION.post(url, json={'sql': sql, 'args': args}, headers=headers, timeout=_GRIST_READ_TIMEOUT)
+        if resp.status_code != 200:
+            raise RuntimeError(f'Failed to query records: HTTP {resp.status_code} - {resp.text}')
+        payload = _parse_response_json_safe(resp)
+        return payload.get('records', []) if isinstance(payload, dict) else []
+
+    records = fetch_cached_query(config, ('sql', sql, tuple(args)), _load)
+    return _collect_finess_duplicates(records, current_uuid, finess_values)
+
+
+def _collect_finess_duplicates(records: list, current_uuid: str, finess_values: set) -> set:
+    """Intersect finess_values once with every FINESS used by the other records."""
+    cur = normalize_finess(current_uuid)
+    used = set()
     for rec in records:
-        fields = rec.get('fields', {}) if isinstance(rec, dict) else {}
-        rec_uuid = normalize_finess(fields.get('uuid'))
-        if cur and rec_uuid == cur:
+        fields = rec.get('fields') if isinstance(rec, dict) else None
+        if not isinstance(fields, dict) or (cur and normalize_finess(fields.get('uuid')) == cur):
             continue
-        rec_finess = extract_finess_values(fields)
-        duplicates.update(finess_values.intersection(rec_finess))
+        used |= extract_finess_values(fields)
+        if finess_values <= used:
+            break
+    return finess_values & used
+
 
+def find_duplicate_finess(config: dict, current_uuid: str, finess_values: set, headers: dict):
+    """Find FINESS values already used by another record in the same table.
+
+    A warm cached index answers directly. Otherwise one SQL query covers both
+    FINESS columns; its result is final because it matches every variant
+    normalize_finess accepts (case, surrounding whitespace, 8-digit padding).
+    When the SQL endpoint is refused or times out, the records filter checks
+    finess_main and the full-table scan only runs if it finds nothing.
+    """
+    if not finess_values:
+        return set()
+
+    if not _records_cache_is_warm(config):
+        try:
+            return find_finess_duplicates_sql(config, current_uuid, finess_values, headers)
+        except (RuntimeError, requests.RequestException):
+            duplicates = find_main_finess_duplicates(config, current_uuid, finess_values, headers)
+            if duplicates:
+                return duplicates
+
+    index = fetch_finess_index(config, headers)
+    cur = normalize_finess(current_uuid)
+    duplicates = set()
+    for value in finess_values:
+        owners = index.get(value)
+        if owners and (not cur or owners != {cur}):
+            duplicates.add(value)
     return duplicates
 
 
@@ -5839,29 +6256,40 @@ def get_record(form_id: str):
     if not uuid:
         return jsonify({'error': 'UUID parameter required'}), 400
 
-    # Build Grist API URL with filter
-    filter_param = f'{{"uuid":["{uuid}"]}}'
     url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}/records"
 
-    headers = {'Accept': 'application/json'}
     # API key optional for read if doc is public
-    if config['api_key']:
-        headers['Authorization'] = f"Bearer {config['api_key']}"
+    headers = grist_headers(config.get('api_key'))
 
     try:
         allowed_columns = get_table_columns(config, headers)
         record_key = resolve_record_key(allowed_columns)
         if not record_key:
             return jsonify({'error': 'Target table has no supported record key (uuid or id_tally).'}), 500
-        resp = requests.get(
+        # Always read Grist: the shared table cache is only cleared by the worker that
+        # saved, so it could hand a user their pre-save record.
+        resp = GRIST_SESSION.get(
             url,
-            params={'filter': json.dumps({record_key: [uuid]})},
+            params={'filter': grist_filter(**{record_key: uuid})},
             headers=headers,
         )
-        return jsonify(resp.json()), resp.status_code
+        if resp.status_code == 200:
+            # Forward Grist's JSON body as-is instead of decoding and re-encoding it.
+            response = Response(resp.content, status=200, mimetype='application/json')
+        else:
+            response = jsonify(_parse_response_json_safe(resp))
+            response.status_code = resp.status_code
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+    if response.status_code == 200:
+        # Browsers revalidate every time; an unchanged record comes back as an empty 304.
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=12).hexdigest())
+        response.cache_control.no_cache = True
+        response.cache_control.private = True
+        response.make_conditional(request)
+    return response
+
 
 @app.route('/api/forms/<form_id>/write-token', methods=['GET'])
 def issue_public_write_token(form_id: str):
@@ -6079,11 +6507,7 @@ def save_record(form_id: str):
         return jsonify({'error': str(e)}), 400
 
     base_url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}"
-    headers = {
-        'Authorization': f"Bearer {config['api_key']}",
-        'Content-Type': 'application/json',
-        'Accept': 'application/json',
-    }
+    headers = grist_headers(config['api_key'], write=True)
 
     # Keep only fields that exist in target table (prod/local may differ).
     try:
@@ -6101,19 +6525,34 @@ def save_record(form_id: str):
     if record_key not in filtered_fields:
         filtered_fields[record_key] = uuid
 
+    # The existence check and the FINESS uniqueness scan are independent: overlap them.
+    # A fresh cached table read (from a recent FINESS check) can supply the record id;
+    # eures-beta copies the existing admin fields into the update, so it always reads them from Grist.
+    incoming_finess = extract_finess_values(filtered_fields)
+    existing_record = None
+    if form_id != 'eures-beta':
+        existing_record = find_cached_record(config, record_key, filtered_fields[record_key])
+    existing_future = None
+    if existing_record is None:
+        existing_future = _GRIST_POOL.submit(fetch_record_by_field, base_url, record_key, filtered_fields[record_key], headers)
+    duplicates_future = (
+        _GRIST_POOL.submit(find_duplicate_finess, config, uuid, incoming_finess, headers)
+        if incoming_finess else None
+    )
+
     # Check if record exists
     try:
-        existing_record, check_resp = fetch_record_by_field(base_url, record_key, filtered_fields[record_key], headers)
-        if check_resp.status_code != 200:
-            return jsonify(_parse_response_json_safe(check_resp)), check_resp.status_code
+        if existing_future is not None:
+            existing_record, check_resp = existing_future.result()
+            if check_resp.status_code != 200:
+                return jsonify(_parse_response_json_safe(check_resp)), check_resp.status_code
         record_id = existing_record.get('id') if isinstance(existing_record, dict) else None
     except Exception as e:
         return jsonify({'error': f'Failed to check existing record: {e}'}), 500
 
     # Enforce uniqueness of FINESS across records (excluding current UUID)
     try:
-        incoming_finess = extract_finess_values(filtered_fields)
-        duplicates = find_duplicate_finess(config, uuid, incoming_finess, headers)
+        duplicates = duplicates_future.result() if duplicates_future else set()
         if duplicates:
             duplicates_sorted = sorted(duplicates)
             return jsonify({
@@ -6158,6 +6597,7 @@ def save_record(form_id: str):
 
         if resp.status_code != 200:
             return jsonify(_parse_response_json_safe(resp)), resp.status_code
+        invalidate_records_cache(config)
 
         saved_record, verify_resp = fetch_record_by_field(base_url, record_key, filtered_fields[record_key], headers)
         if verify_resp.status_code != 200:
@@ -6297,9 +6737,10 @@ def check_finess(form_id: str):
         return jsonify({'error': 'Invalid request body: finess must be a list'}), 400
 
     finess_values = {normalize_finess(v) for v in raw_finess if normalize_finess(v)}
-    headers = {'Accept': 'application/json'}
-    if config['api_key']:
-        headers['Authorization'] = f"Bearer {config['api_key']}"
+    if not finess_values:
+        # Form renders that send no FINESS yet: nothing to look up.
+        return jsonify({'ok': True, 'duplicates': [], 'has_duplicates': False})
+    headers = grist_headers(config.get('api_key'))
 
     try:
         duplicates = sorted(find_duplicate_finess(config, uuid, finess_values, headers))
@@ -6307,7 +6748,7 @@ def check_finess(form_id: str):
             'ok': True,
             'duplicates': duplicates,
             'has_duplicates': len(duplicates) > 0,
-        }), 200
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -6335,61 +6776,56 @@ def recover_by_email(form_id: str):
         return jsonify({'error': 'FINESS invalide'}), 400
 
     url = f"{GRIST_BASE_URL}/api/docs/{config['doc_id']}/tables/{config['table_id']}/records"
-    headers = {'Accept': 'application/json'}
-    if config['api_key']:
-        headers['Authorization'] = f"Bearer {config['api_key']}"
-
-    try:
-        # 1) Fast path: exact filter on the email column.
-        filter_param = json.dumps({"validateur_email": [email]})
-        resp = requests.get(url, params={'filter': filter_param, 'limit': 5000}, headers=headers)
-        if resp.status_code != 200:
-            return jsonify(resp.json()), resp.status_code
-        payload = resp.json()
-        records = payload.get('records', [])
+    headers = grist_headers(config.get('api_key'))
 
-        matches = []
+    def _latest_match(records):
+        """Return the newest matching record and the match count, in one pass."""
+        latest, latest_id, count = None, -1, 0
         for rec in records:
             fields = rec.get('fields', {}) if isinstance(rec, dict) else {}
             if not fields.get('uuid'):
                 continue
-            if finess:
-                rec_finess = extract_finess_values(fields)
-                if finess not in rec_finess:
-                    continue
-            matches.append(rec)
-
-        # 2) Fallback: scan and compare case-insensitively (older rows / casing differences).
-        if not matches:
-            scan_resp = requests.get(url, params={'limit': 5000}, headers=headers)
-            if scan_resp.status_code != 200:
-                return jsonify(scan_resp.json()), scan_resp.status_code
-            scan_payload = scan_resp.json()
-            for rec in scan_payload.get('records', []):
-                fields = rec.get('fields', {}) if isinstance(rec, dict) else {}
-                if normalize_email(fields.get('validateur_email')) != email:
-                    continue
-                if not fields.get('uuid'):
-                    continue
-                if finess:
-                    rec_finess = extract_finess_values(fields)
-                    if finess not in rec_finess:
-                        continue
-                matches.append(rec)
+            if finess and finess not in extract_finess_values(fields):
+                continue
+            count += 1
+            rec_id = int(rec.get('id', 0) or 0)
+            if rec_id > latest_id:
+                latest, latest_id = rec, rec_id
+        return latest, count
 
-        if not matches:
+    try:
+        # 1) Fast path: exact filter on the email column.
+        filter_param = grist_filter(validateur_email=email)
+        resp = GRIST_SESSION.get(url, params={'filter': filter_param, 'limit': 5000}, headers=headers)
+        if resp.status_code != 200:
+            return jsonify(_parse_response_json_safe(resp)), resp.status_code
+        payload = orjson.loads(resp.content)
+        chosen, count = _latest_match(payload.get('records', []))
+
+        # 2) Fallback: case-insensitive lookup (older rows / casing differences),
+        # from a still-fresh cached table read, else through Grist SQL.
+        if not count:
+            if _records_cache_is_warm(config):
+                candidates = fetch_email_index(config, headers).get(email, [])
+            else:
+                try:
+                    candidates = find_records_by_email_sql(config, email, headers, with_finess=bool(finess))
+                except RuntimeError:
+                    candidates = fetch_email_index(config, headers).get(email, [])
+            chosen, count = _latest_match(candidates)
+
+        if not count:
             if finess:
                 return jsonify({'error': 'Aucun questionnaire trouvé pour ce couple email + FINESS.'}), 404
             return jsonify({'error': 'Aucun questionnaire trouvé pour cet email.'}), 404
 
-        chosen = max(matches, key=lambda r: int(r.get('id', 0) or 0))
         chosen_fields = chosen.get('fields', {}) if isinstance(chosen, dict) else {}
         return jsonify({
             'ok': True,
             'uuid': chosen_fields.get('uuid'),
-            'count': len(matches),
+            'count': count,
             'match_on': 'email+finess' if finess else 'email',
-        }), 200
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -6405,9 +6841,7 @@ def admin_overview(form_id: str):
     if not config:
         return jsonify({'error': f'Unknown form: {form_id}'}), 404
 
-    headers = {'Accept': 'application/json'}
-    if config['api_key']:
-        headers['Authorization'] = f"Bearer {config['api_key']}"
+    headers = grist_headers(config.get('api_key'))
 
     search = str(request.args.get('search', '') or '').strip().lower()
     status = str(request.args.get('status', 'all') or 'all').strip().lower()
@@ -6434,6 +6868,11 @@ def admin_overview(form_id: str):
             'saisie_terminee': _as_bool(fields.get('saisie_terminee')),
         }
         row['quick_progress'] = compute_quick_step_progress(fields)
+        if search:
+            row['_search'] = (
+                f"{row['es_nom']} {row['departement']} {row['finess_main']} {row['validateur_nom']} "
+                f"{row['validateur_prenom']} {row['validateur_email']} {row['uuid']}"
+            ).lower()
         rows.append(row)
 
     total = len(rows)
@@ -6448,18 +6887,9 @@ def admin_overview(form_id: str):
         rows = [r for r in rows if r['saisie_terminee'] is want_done]
 
     if search:
-        def _matches(r):
-            haystack = ' '.join([
-                str(r.get('es_nom', '')),
-                str(r.get('departement', '')),
-                str(r.get('finess_main', '')),
-                str(r.get('validateur_nom', '')),
-                str(r.get('validateur_prenom', '')),
-                str(r.get('validateur_email', '')),
-                str(r.get('uuid', '')),
-            ]).lower()
-            return search in haystack
-        rows = [r for r in rows if _matches(r)]
+        rows = [r for r in rows if search in r['_search']]
+        for r in rows:
+            del r['_search']
 
     return jsonify({
         'ok': True,
@@ -6470,7 +6900,7 @@ def admin_overview(form_id: str):
             'termines': termines,
         },
         'rows': rows,
-    }), 200
+    })
 
 
 @app.route('/api/forms/<form_id>/admin/invitations', methods=['GET'])
@@ -7970,6 +8400,34 @@ def index():
 
 
 # Static file serving for forms and frontend
+def _load_html_cache() -> dict[tuple[str, str], tuple[bytes, str]]:
+    """Read form and admin pages once at startup, keyed by (form_id, filename)."""
+    cache = {}
+    for page in FORMS_DIR.glob('*/*.html'):
+        if page.name in {'index.html', 'admin.html'}:
+            content = page.read_bytes()
+            cache[(page.parent.name, page.name)] = (content, hashlib.blake2b(content, digest_size=8).hexdigest())
+    return cache
+
+
+_HTML_CACHE = _load_html_cache()
+
+
+def _serve_cached_html(form_id: str, filename: str) -> Response:
+    """Serve a preloaded page with its ETag; debug mode reads from disk for live edits."""
+    cached = None if app.debug else _HTML_CACHE.get((form_id, filename))
+    if cached is None:
+        response = send_from_directory(FORMS_DIR / form_id, filename)
+    else:
+        content, etag = cached
+        response = Response(content, mimetype='text/html')
+        response.set_etag(etag)
+        response.make_conditional(request)
+    # Always revalidate: unchanged pages come back as 304 thanks to the ETag.
+    response.cache_control.no_cache = True
+    return response
+
+
 @app.route('/forms/<form_id>/')
 @app.route('/forms/<form_id>')
 def serve_form(form_id: str):
@@ -7977,18 +8435,21 @@ def serve_form(form_id: str):
     proxied = maybe_proxy_eures_request(form_id)
     if proxied:
         return proxied
-    return send_from_directory(FORMS_DIR / form_id, 'index.html')
+    return _serve_cached_html(form_id, 'index.html')
 
 
 @app.route('/forms/fagerh/questions-pdf')
 def serve_fagerh_questions_pdf():
     """Serve the reference PDF containing FAGERH questions."""
-    return send_from_directory(
+    response = send_from_directory(
         DOCS_DIR,
         'fagerh_questions_completes.pdf',
         as_attachment=True,
         download_name='fagerh_questions_fagerh.pdf',
+        max_age=STATIC_ASSETS_MAX_AGE_SECONDS,
     )
+    response.cache_control.public = True
+    return response
 
 
 @app.route('/forms/<form_id>/<path:filename>')
@@ -8000,7 +8461,14 @@ def serve_form_file(form_id: str, filename: str):
     resolved = _resolve_form_path(form_id, filename)
     if not resolved:
         return jsonify({'error': 'File not found'}), 404
-    return send_from_directory(FORMS_DIR / form_id, resolved)
+    if resolved.endswith('.html'):
+        # Pages revalidate like the main form page; their scripts and styles may change on deploy.
+        response = send_from_directory(FORMS_DIR / form_id, resolved)
+        response.cache_control.no_cache = True
+        return response
+    response = send_from_directory(FORMS_DIR / form_id, resolved, max_age=STATIC_ASSETS_MAX_AGE_SECONDS)
+    response.cache_control.public = True
+    return response
 
 
 @app.route('/admin/<form_id>/login', methods=['GET', 'POST'])
@@ -8148,13 +8616,17 @@ def serve_admin(form_id: str):
     proxied = maybe_proxy_eures_request(form_id)
     if proxied:
         return proxied
-    return send_from_directory(FORMS_DIR / form_id, 'admin.html')
+    response = _serve_cached_html(form_id, 'admin.html')
+    response.cache_control.private = True
+    return response
 
 
 @app.route('/assets/<path:filename>')
 def serve_assets(filename: str):
     """Serve static assets (JS, CSS)."""
-    return send_from_directory(ASSETS_DIR, filename)
+    response = send_from_directory(ASSETS_DIR, filename, max_age=STATIC_ASSETS_MAX_AGE_SECONDS)
+    response.cache_control.public = True
+    return response
 
 if fagerh_suivi_app is not None:
     app.wsgi_app = DispatcherMiddleware(
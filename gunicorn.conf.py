@@ -0,0 +1,14 @@
+"""
+gunicorn settings used by the Procfile.
+
+Handlers mostly wait on Grist, so gevent workers each serve many requests
+concurrently; the gevent worker patches the standard library itself.
+The number of workers comes from WEB_CONCURRENCY (read by gunicorn).
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5005')}"
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', '500'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
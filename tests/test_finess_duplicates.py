@@ -0,0 +1,297 @@
+import sqlite3
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import orjson
+import requests
+
+import app
+
+
+class FinessDuplicatesTest(unittest.TestCase):
+    def setUp(self):
+        self.config = {
+            'doc_id': 'doc-id',
+            'table_id': 'Reponses',
+            'api_key': 'api-key',
+        }
+        self.headers = {'Authorization': 'Bearer api-key'}
+        app._RECORDS_CACHE.clear()
+        app._QUERY_CACHE.clear()
+        self.addCleanup(app._RECORDS_CACHE.clear)
+        self.addCleanup(app._QUERY_CACHE.clear)
+
+    def _records_response(self, records):
+        return Mock(status_code=200, content=orjson.dumps({'records': records}))
+
+    def _fake_grist(self, session_get, filtered_records, all_records):
+        self.doc_state = 'state-1'
+
+        def fake_get(url, params=None, headers=None, **kwargs):
+            if url.endswith('/states'):
+                return Mock(status_code=200, content=orjson.dumps({'states': [{'n': 1, 'h': self.doc_state}]}))
+            if 'filter' in (params or {}):
+                return self._records_response(filtered_records)
+            return self._records_response(all_records)
+        session_get.side_effect = fake_get
+
+    def _full_reads(self, session_get):
+        return sum(
+            1 for call in session_get.call_args_list
+            if call.args[0].endswith('/records') and 'filter' not in (call.kwargs.get('params') or {})
+        )
+
+    def _sql_response(self, status_code=200, records=()):
+        return Mock(status_code=status_code, text='', content=orjson.dumps({
+            'records': [{'fields': fields} for fields in records],
+        }))
+
+    def _sqlite_grist(self, session_post, rows):
+        """Answer Grist SQL requests from a real SQLite table holding rows."""
+        db = sqlite3.connect(':memory:')
+        db.row_factory = sqlite3.Row
+        db.execute('PRAGMA case_sensitive_like = ON')
+        db.execute('CREATE TABLE "Reponses" (uuid TEXT, finess_main, finess_json TEXT)')
+        db.executemany('INSERT INTO "Reponses" VALUES (?, ?, ?)', rows)
+        self.addCleanup(db.close)
+
+        def fake_post(url, json=None, headers=None, **kwargs):
+            result = db.execute(json['sql'], json['args']).fetchall()
+            return self._sql_response(records=[dict(row) for row in result])
+        session_post.side_effect = fake_post
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_sql_matches_unnormalised_finess_main_like_the_cached_index(self, session_get, session_post):
+        rows = [
+            ('padded', ' 123456789 ', None),
+            ('lower', '2a0000001', None),
+            ('numeric', 12345678, None),
+            ('tab', '\t987654321\n', None),
+            ('own', '111111111', None),
+        ]
+        self._sqlite_grist(session_post, rows)
+        finess_values = {'123456789', '2A0000001', '012345678', '987654321', '111111111', '222222222'}
+
+        cold = app.find_duplicate_finess(self.config, 'own', finess_values, self.headers)
+
+        session_get.assert_not_called()
+        self.assertEqual(cold, {'123456789', '2A0000001', '012345678', '987654321'})
+        app._RECORDS_CACHE[('doc-id', 'Reponses')] = {
+            'records': [{'id': i, 'fields': {'uuid': u, 'finess_main': m}} for i, (u, m, _) in enumerate(rows, 1)],
+            'loaded_at': app.time.monotonic(),
+        }
+        self.assertEqual(app.find_duplicate_finess(self.config, 'own', finess_values, self.headers), cold)
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_sql_matches_unnormalised_finess_json_like_the_cached_index(self, session_get, session_post):
+        rows = [
+            ('lower', None, '["2a0000001"]'),
+            ('spaced', None, '[" 123456789 ", "999999999"]'),
+            ('numeric', None, '[12345678]'),
+            ('list-cell', None, '["L", "333333333"]'),
+            ('own', None, '["111111111"]'),
+        ]
+        self._sqlite_grist(session_post, rows)
+        finess_values = {'2A0000001', '123456789', '012345678', '333333333', '111111111', '444444444'}
+
+        cold = app.find_duplicate_finess(self.config, 'own', finess_values, self.headers)
+
+        session_get.assert_not_called()
+        self.assertEqual(cold, {'2A0000001', '123456789', '012345678', '333333333'})
+        app._RECORDS_CACHE[('doc-id', 'Reponses')] = {
+            'records': [{'id': i, 'fields': {'uuid': u, 'finess_json': j}} for i, (u, _, j) in enumerate(rows, 1)],
+            'loaded_at': app.time.monotonic(),
+        }
+        self.assertEqual(app.find_duplicate_finess(self.config, 'own', finess_values, self.headers), cold)
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_duplicates_exclude_current_uuid(self, session_get, session_post):
+        records = [
+            {'id': 1, 'fields': {'uuid': 'own', 'finess_main': '123456789'}},
+            {'id': 2, 'fields': {'uuid': 'other', 'finess_json': '["12345678", "999999999"]'}},
+        ]
+        self._fake_grist(session_get, records[:1], records)
+        session_post.return_value = self._sql_response(records=[
+            {'uuid': 'own', 'finess_main': '123456789', 'finess_json': None},
+            {'uuid': 'other', 'finess_main': None, 'finess_json': '["12345678", "999999999"]'},
+        ])
+
+        duplicates = app.find_duplicate_finess(self.config, 'own', {'123456789', '012345678', '111111111'}, self.headers)
+
+        self.assertEqual(duplicates, {'012345678'})
+        session_get.assert_not_called()
+        session_post.assert_called_once()
+        self.assertTrue(session_post.call_args.args[0].endswith('/api/docs/doc-id/sql'))
+        sql_body = session_post.call_args.kwargs['json']
+        self.assertIn('FROM "Reponses"', sql_body['sql'])
+        self.assertIn('UPPER(TRIM(CAST(finess_main AS TEXT)', sql_body['sql'])
+        self.assertIn('UPPER(finess_json) LIKE', sql_body['sql'])
+        self.assertEqual(sql_body['sql'].count('?'), len(sql_body['args']))
+        self.assertIn('12345678', sql_body['args'])
+        self.assertIn('012345678', sql_body['args'])
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_without_sql_main_finess_collision_skips_full_table_read(self, session_get, session_post):
+        records = [{'id': 1, 'fields': {'uuid': 'other', 'finess_main': 12345678}}]
+        self._fake_grist(session_get, records, records)
+        session_post.return_value = self._sql_response(status_code=403)
+
+        duplicates = app.find_duplicate_finess(self.config, 'own', {'012345678'}, self.headers)
+
+        self.assertEqual(duplicates, {'012345678'})
+        session_get.assert_called_once()
+        self.assertIn('"12345678"', session_get.call_args.kwargs['params']['filter'])
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_sql_timeout_falls_back_like_a_refused_query(self, session_get, session_post):
+        records = [{'id': 1, 'fields': {'uuid': 'other', 'finess_main': '123456789'}}]
+        self._fake_grist(session_get, records, records)
+        session_post.side_effect = requests.ReadTimeout('slow')
+        client = app.app.test_client()
+        with patch.object(app, 'get_form_config', return_value=self.config):
+            response = client.post('/api/forms/fagerh/check-finess', json={'uuid': 'own', 'finess': ['123456789']})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'ok': True, 'duplicates': ['123456789'], 'has_duplicates': True})
+        self.assertIn('filter', session_get.call_args.kwargs['params'])
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_filtered_reads_are_cached_until_invalidated(self, session_get, session_post):
+        self._fake_grist(session_get, [], [])
+        session_post.return_value = self._sql_response(records=[
+            {'uuid': 'other', 'finess_main': None, 'finess_json': '["123456789"]'},
+        ])
+
+        for _ in range(3):
+            self.assertEqual(app.find_duplicate_finess(self.config, 'own', {'123456789'}, self.headers), {'123456789'})
+        self.assertEqual((session_get.call_count, session_post.call_count), (0, 1))
+
+        app.invalidate_records_cache(self.config)
+        app.find_duplicate_finess(self.config, 'own', {'123456789'}, self.headers)
+        self.assertEqual((session_get.call_count, session_post.call_count), (0, 2))
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_full_table_read_is_cached_until_invalidated(self, session_get, session_post):
+        session_post.return_value = self._sql_response(status_code=403)
+        self._fake_grist(session_get, [], [
+            {'id': 1, 'fields': {'uuid': 'other', 'finess_json': ['123456789']}},
+        ])
+
+        self.assertEqual(app.find_duplicate_finess(self.config, 'own', {'123456789'}, self.headers), {'123456789'})
+        calls_after_first_check = session_get.call_count
+        self.assertEqual(app.find_duplicate_finess(self.config, 'own', {'123456789'}, self.headers), {'123456789'})
+        self.assertEqual(session_get.call_count, calls_after_first_check)
+        self.assertEqual(self._full_reads(session_get), 1)
+
+        app.invalidate_records_cache(self.config)
+        app.find_duplicate_finess(self.config, 'own', {'123456789'}, self.headers)
+        self.assertEqual(self._full_reads(session_get), 2)
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_expired_read_is_kept_while_document_state_is_unchanged(self, session_get):
+        self._fake_grist(session_get, [], [{'id': 1, 'fields': {'uuid': 'other'}}])
+        cache_key = ('doc-id', 'Reponses')
+
+        app.fetch_all_records(self.config, self.headers)
+        self.assertEqual(session_get.call_count, 1)
+        app._RECORDS_CACHE[cache_key]['loaded_at'] -= app._RECORDS_CACHE_TTL_SECONDS
+        first = app.fetch_all_records(self.config, self.headers)
+        self.assertEqual(self._full_reads(session_get), 2)
+
+        app._RECORDS_CACHE[cache_key]['loaded_at'] -= app._RECORDS_CACHE_TTL_SECONDS
+        self.assertIs(app.fetch_all_records(self.config, self.headers), first)
+        self.assertEqual(self._full_reads(session_get), 2)
+
+        self.doc_state = 'state-2'
+        app._RECORDS_CACHE[cache_key]['loaded_at'] -= app._RECORDS_CACHE_TTL_SECONDS
+        app.fetch_all_records(self.config, self.headers)
+        self.assertEqual(self._full_reads(session_get), 3)
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_concurrent_full_reads_share_one_upstream_call(self, session_get):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(url, params=None, headers=None, **kwargs):
+            if url.endswith('/states'):
+                return Mock(status_code=404, content=b'')
+            started.set()
+            release.wait(5)
+            return self._records_response([{'id': 1, 'fields': {'uuid': 'other'}}])
+        session_get.side_effect = slow_get
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(app.fetch_all_records(self.config, self.headers)))]
+        threads[0].start()
+        started.wait(5)
+        for _ in range(3):
+            thread = threading.Thread(target=lambda: results.append(app.fetch_all_records(self.config, self.headers)))
+            threads.append(thread)
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(self._full_reads(session_get), 1)
+        self.assertTrue(all(records is results[0] for records in results))
+
+    @patch.object(app, '_INFLIGHT_WAIT_SECONDS', 0.05)
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_hung_leader_does_not_fail_waiting_reads(self, session_get):
+        started = threading.Event()
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def get(url, params=None, headers=None, **kwargs):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+            return self._records_response([{'id': 1, 'fields': {'uuid': 'other'}}])
+        session_get.side_effect = get
+
+        leader = threading.Thread(target=app.fetch_all_records, args=(self.config, self.headers))
+        leader.start()
+        started.wait(5)
+        records = app.fetch_all_records(self.config, self.headers)
+        release.set()
+        leader.join(5)
+
+        self.assertEqual(records, [{'id': 1, 'fields': {'uuid': 'other'}}])
+        self.assertEqual(self._full_reads(session_get), 2)
+        self.assertTrue(all(call.kwargs['timeout'] == app._GRIST_READ_TIMEOUT for call in session_get.call_args_list))
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_check_finess_accepts_non_ascii_digits(self, session_get, session_post):
+        self._fake_grist(session_get, [], [])
+        session_post.return_value = self._sql_response(records=[])
+        client = app.app.test_client()
+        with patch.object(app, 'get_form_config', return_value=self.config):
+            response = client.post('/api/forms/fagerh/check-finess', json={'uuid': 'own', 'finess': ['12345678\u00b2']})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'ok': True, 'duplicates': [], 'has_duplicates': False})
+        self.assertEqual(session_post.call_args.kwargs['json']['args'][0], '12345678\u00b2')
+
+    @patch.object(app, 'find_duplicate_finess')
+    def test_check_finess_without_values_skips_lookup(self, find_duplicate_finess):
+        client = app.app.test_client()
+        with patch.object(app, 'get_form_config', return_value=self.config):
+            response = client.post('/api/forms/fagerh/check-finess', json={'uuid': 'own', 'finess': ['', '  ']})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'ok': True, 'duplicates': [], 'has_duplicates': False})
+        find_duplicate_finess.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import orjson
+
+import app
+
+
+class GetRecordTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+        self.config = {
+            'doc_id': 'doc-id',
+            'table_id': 'Reponses',
+            'api_key': 'api-key',
+        }
+        self.config_patch = patch.object(app, 'get_form_config', return_value=self.config)
+        self.columns_patch = patch.object(app, 'get_table_columns', return_value={'uuid', 'finess_main'})
+        self.config_patch.start()
+        self.columns_patch.start()
+        self.addCleanup(self.config_patch.stop)
+        self.addCleanup(self.columns_patch.stop)
+        app._RECORDS_CACHE.clear()
+        self.addCleanup(app._RECORDS_CACHE.clear)
+        self.record = {'id': 3, 'fields': {'uuid': 'abc', 'finess_main': '123456789'}}
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_record_has_etag_and_revalidates_to_304(self, session_get):
+        session_get.return_value = Mock(status_code=200, content=orjson.dumps({'records': [self.record]}))
+
+        response = self.client.get('/api/forms/fagerh/record?uuid=abc')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'records': [self.record]})
+        self.assertTrue(response.cache_control.no_cache)
+        self.assertTrue(response.cache_control.private)
+        self.assertEqual(session_get.call_args.kwargs['params'], {'filter': '{"uuid":["abc"]}'})
+
+        revalidated = self.client.get('/api/forms/fagerh/record?uuid=abc', headers={
+            'If-None-Match': response.headers['ETag'],
+        })
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.data, b'')
+        self.assertEqual(session_get.call_count, 2)
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_record_is_read_from_grist_even_with_a_warm_table_cache(self, session_get):
+        app._RECORDS_CACHE[('doc-id', 'Reponses')] = {
+            'records': [{'id': 3, 'fields': {'uuid': 'abc', 'finess_main': 'stale'}}],
+            'loaded_at': app.time.monotonic(),
+        }
+        body = orjson.dumps({'records': [self.record]})
+        session_get.return_value = Mock(status_code=200, content=body)
+
+        response = self.client.get('/api/forms/fagerh/record?uuid=abc')
+        revalidated = self.client.get('/api/forms/fagerh/record?uuid=abc', headers={
+            'If-None-Match': response.headers['ETag'],
+        })
+
+        self.assertEqual(response.data, body)
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(session_get.call_count, 2)
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_upstream_errors_are_not_cached(self, session_get):
+        session_get.return_value = Mock(status_code=403, content=orjson.dumps({'error': 'No view access'}))
+
+        response = self.client.get('/api/forms/fagerh/record?uuid=abc')
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.get_json(), {'error': 'No view access'})
+        self.assertNotIn('ETag', response.headers)
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_grist_body_is_forwarded_unchanged(self, session_get):
+        body = b'{"records": [{"id": 3, "fields": {"uuid": "abc"}}]}'
+        session_get.return_value = Mock(status_code=200, content=body)
+
+        response = self.client.get('/api/forms/fagerh/record?uuid=abc')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, body)
+        self.assertEqual(response.mimetype, 'application/json')
+
+
+if __name__ == '__main__':
+    unittest.main()
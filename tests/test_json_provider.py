@@ -0,0 +1,78 @@
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import UUID
+
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+import app
+
+
+class OrjsonProviderTest(unittest.TestCase):
+    def setUp(self):
+        self.flask_app = app.app
+        self.stdlib = DefaultJSONProvider(self.flask_app)
+
+    def test_big_integers_round_trip_exactly(self):
+        big = 123456789012345678901234567890
+        with self.flask_app.test_request_context(data=b'{"n": 123456789012345678901234567890}', content_type='application/json'):
+            self.assertEqual(request.get_json(), {'n': big})
+            response = app.jsonify({'n': big, 'ok': True})
+
+        self.assertEqual(response.data, b'{"n":123456789012345678901234567890,"ok":true}\n')
+        self.assertEqual(self.flask_app.json.loads('[-%d]' % big), [-big])
+
+    def test_dates_decimals_and_uuids_match_flask_output(self):
+        payload = {
+            'when': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            'day': date(2024, 1, 2),
+            'amount': Decimal('1.50'),
+            'id': UUID(int=5),
+            'b': [1, {'z': 'é', 'a': None}],
+        }
+        with self.flask_app.app_context():
+            response = app.jsonify(payload)
+
+        self.assertEqual(
+            self.flask_app.json.loads(response.data),
+            self.stdlib.loads(self.stdlib.dumps(payload)),
+        )
+        self.assertEqual(response.data.index(b'"amount"'), 1)
+
+    def test_debug_mode_keeps_indented_output(self):
+        self.addCleanup(setattr, self.flask_app, 'debug', self.flask_app.debug)
+        self.flask_app.debug = True
+        with self.flask_app.app_context():
+            response = app.jsonify({'b': 1, 'a': [1, 2]})
+            expected = self.stdlib.response({'b': 1, 'a': [1, 2]})
+
+        self.assertEqual(response.data, expected.data)
+        self.assertIn(b'\n  "a"', response.data)
+
+    def test_api_responses_share_the_jsonify_encoding(self):
+        config = {'doc_id': 'doc-id', 'table_id': 'Reponses', 'api_key': 'api-key'}
+        with patch.object(app, 'get_form_config', return_value=config), \
+                patch.object(app, 'find_duplicate_finess', return_value={'123456789'}):
+            response = self.flask_app.test_client().post(
+                '/api/forms/fagerh/check-finess', json={'uuid': 'own', 'finess': ['123456789']},
+            )
+
+        self.assertEqual(response.data, b'{"duplicates":["123456789"],"has_duplicates":true,"ok":true}\n')
+
+    def test_session_cookie_round_trip(self):
+        value = {
+            'admin': {'form_id': 'fagerh', 'expires': 1700000000},
+            'seen_at': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            'raw': b'\x00\xff',
+            'pair': ('a', 1),
+            'big': 2 ** 70,
+        }
+        with self.flask_app.app_context():
+            serializer = self.flask_app.session_interface.get_signing_serializer(self.flask_app)
+            self.assertEqual(serializer.loads(serializer.dumps(value)), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import sqlite3
+import unittest
+from unittest.mock import Mock, patch
+
+import orjson
+
+import app
+
+
+class RecoverByEmailTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+        self.config_patch = patch.object(app, 'get_form_config', return_value={
+            'doc_id': 'doc-id',
+            'table_id': 'Reponses',
+            'api_key': 'api-key',
+        })
+        self.config_patch.start()
+        self.addCleanup(self.config_patch.stop)
+        app._RECORDS_CACHE.clear()
+        self.addCleanup(app._RECORDS_CACHE.clear)
+
+    def _records_response(self, records):
+        return Mock(status_code=200, content=orjson.dumps({'records': records}))
+
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_exact_match_returns_latest_record(self, session_get):
+        session_get.return_value = self._records_response([
+            {'id': 3, 'fields': {'uuid': 'older', 'validateur_email': 'test@example.org'}},
+            {'id': 9, 'fields': {'uuid': 'newest', 'validateur_email': 'test@example.org'}},
+            {'id': 12, 'fields': {'uuid': '', 'validateur_email': 'test@example.org'}},
+        ])
+
+        response = self.client.post('/api/forms/fagerh/recover-by-email', json={'email': 'Test@Example.org'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {
+            'ok': True,
+            'uuid': 'newest',
+            'count': 2,
+            'match_on': 'email',
+        })
+        session_get.assert_called_once()
+
+    def _sql_response(self, rows, status_code=200):
+        return Mock(status_code=status_code, text='', content=orjson.dumps({
+            'records': [{'fields': fields} for fields in rows],
+        }))
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_case_insensitive_fallback_filters_on_finess(self, session_get, session_post):
+        session_get.return_value = self._records_response([])
+        session_post.return_value = self._sql_response([
+            {'id': 4, 'uuid': 'match', 'validateur_email': 'TEST@example.org', 'finess_main': '12345678', 'finess_json': None},
+            {'id': 8, 'uuid': 'other-finess', 'validateur_email': 'test@example.org', 'finess_main': '999999999', 'finess_json': None},
+        ])
+
+        response = self.client.post('/api/forms/fagerh/recover-by-email', json={
+            'email': 'test@example.org',
+            'finess': '012345678',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['uuid'], 'match')
+        self.assertEqual(response.get_json()['count'], 1)
+        session_get.assert_called_once()
+        sql_body = session_post.call_args.kwargs['json']
+        self.assertIn('LOWER(TRIM(validateur_email, ', sql_body['sql'])
+        self.assertEqual(sql_body['args'], ['test@example.org'])
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_sql_matches_emails_like_the_cached_index(self, session_get, session_post):
+        rows = [
+            (1, 'newline', 'Test@X.org\n'),
+            (2, 'accent', '\u00c9LOISE@x.fr'),
+            (3, 'decoy', 'A\u00e9loise@x.fr'),
+            (4, 'wildcard', 'a%b@x.org'),
+        ]
+        db = sqlite3.connect(':memory:')
+        db.row_factory = sqlite3.Row
+        db.execute('CREATE TABLE "Reponses" (id INTEGER, uuid TEXT, validateur_email TEXT)')
+        db.executemany('INSERT INTO "Reponses" VALUES (?, ?, ?)', rows)
+        self.addCleanup(db.close)
+
+        def fake_post(url, json=None, headers=None, **kwargs):
+            result = db.execute(json['sql'], json['args']).fetchall()
+            return self._sql_response([dict(row) for row in result])
+        session_post.side_effect = fake_post
+        session_get.return_value = self._records_response([])
+        emails = ['test@x.org', '\u00e9loise@x.fr', 'a_b@x.org', 'a%b@x.org']
+
+        cold = [self.client.post('/api/forms/fagerh/recover-by-email', json={'email': email}) for email in emails]
+        app._RECORDS_CACHE[('doc-id', 'Reponses')] = {
+            'records': [{'id': i, 'fields': {'uuid': u, 'validateur_email': e}} for i, u, e in rows],
+            'loaded_at': app.time.monotonic(),
+        }
+        warm = [self.client.post('/api/forms/fagerh/recover-by-email', json={'email': email}) for email in emails]
+
+        self.assertEqual(
+            [(r.status_code, (r.get_json() or {}).get('uuid')) for r in cold],
+            [(200, 'newline'), (200, 'accent'), (404, None), (200, 'wildcard')],
+        )
+        self.assertEqual([(r.status_code, r.get_json()) for r in warm], [(r.status_code, r.get_json()) for r in cold])
+        self.assertEqual(session_post.call_count, len(emails))
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_fallback_scans_table_when_sql_is_refused(self, session_get, session_post):
+        session_get.side_effect = [
+            self._records_response([]),
+            self._records_response([
+                {'id': 4, 'fields': {'uuid': 'scanned', 'validateur_email': 'TEST@example.org'}},
+            ]),
+        ]
+        session_post.return_value = self._sql_response([], status_code=403)
+
+        response = self.client.post('/api/forms/fagerh/recover-by-email', json={'email': 'test@example.org'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['uuid'], 'scanned')
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_fallback_uses_warm_records_cache(self, session_get, session_post):
+        session_get.side_effect = [
+            self._records_response([
+                {'id': 4, 'fields': {'uuid': 'cached', 'validateur_email': 'Test@Example.org'}},
+            ]),
+            self._records_response([]),
+        ]
+        app.fetch_all_records(app.get_form_config.return_value, {})
+
+        response = self.client.post('/api/forms/fagerh/recover-by-email', json={'email': 'test@example.org'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['uuid'], 'cached')
+        self.assertEqual(session_get.call_count, 2)
+        session_post.assert_not_called()
+
+    @patch.object(app.GRIST_SESSION, 'post')
+    @patch.object(app.GRIST_SESSION, 'get')
+    def test_no_match_returns_404(self, session_get, session_post):
+        session_get.return_value = self._records_response([])
+        session_post.return_value = self._sql_response([])
+
+        response = self.client.post('/api/forms/fagerh/recover-by-email', json={'email': 'nobody@example.org'})
+
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import app
 
@@ -88,6 +88,78 @@ class SaveRecordTest(unittest.TestCase):
         })
         write_grist_records.assert_called_once()
 
+    @patch.object(app, 'write_grist_records')
+    @patch.object(app, 'fetch_record_by_field')
+    @patch.object(app, 'get_form_access_settings', return_value={'read_only': False, 'message': ''})
+    def test_save_rejects_duplicate_finess_without_writing(self, _access, fetch_record_by_field, write_grist_records):
+        fetch_record_by_field.return_value = (None, Mock(status_code=200))
+        app.find_duplicate_finess.return_value = {'123456789'}
+        fields = {**self.fields, 'finess_main': '123456789'}
+        with patch.object(app, 'get_table_columns', return_value=set(fields)):
+            response = self.client.post('/api/forms/fagerh/record', json={'fields': fields})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.get_json()['duplicates'], ['123456789'])
+        fetch_record_by_field.assert_called_once()
+        app.find_duplicate_finess.assert_called_once_with(
+            app.get_form_config.return_value,
+            fields['uuid'],
+            {'123456789'},
+            ANY,
+        )
+        write_grist_records.assert_not_called()
+
+    @patch.object(app, 'write_grist_records')
+    @patch.object(app, 'fetch_record_by_field')
+    @patch.object(app, 'get_form_access_settings', return_value={'read_only': False, 'message': ''})
+    def test_save_reuses_fresh_cached_read_for_existence_check(self, _access, fetch_record_by_field, write_grist_records):
+        self.addCleanup(app._RECORDS_CACHE.clear)
+        app._RECORDS_CACHE[('doc-id', 'Reponses')] = {
+            'records': [{'id': 7, 'fields': {'uuid': self.fields['uuid']}}],
+            'loaded_at': app.time.monotonic(),
+        }
+        app.find_duplicate_finess.return_value = {'123456789'}
+        fields = {**self.fields, 'finess_main': '123456789'}
+        with patch.object(app, 'get_table_columns', return_value=set(fields)):
+            response = self.client.post('/api/forms/fagerh/record', json={'fields': fields})
+
+        self.assertEqual(response.status_code, 409)
+        fetch_record_by_field.assert_not_called()
+        write_grist_records.assert_not_called()
+
+    @patch.object(app, 'link_eures_invitation_after_save', return_value=None)
+    @patch.object(app, 'ensure_table_columns')
+    @patch.object(app, '_check_eures_public_write_rate_limit', return_value=(True, 0))
+    @patch.object(app, '_validate_eures_public_write_token', return_value=(True, ''))
+    @patch.object(app, 'maybe_proxy_eures_request', return_value=None)
+    @patch.object(app, 'write_grist_records')
+    @patch.object(app, 'fetch_record_by_field')
+    @patch.object(app, 'get_form_access_settings', return_value={'read_only': False, 'message': ''})
+    def test_eures_update_reads_admin_fields_from_grist_not_the_cache(self, _access, fetch_record_by_field, write_grist_records, *_eures):
+        self.addCleanup(app._RECORDS_CACHE.clear)
+        app._RECORDS_CACHE[('doc-id', 'Reponses')] = {
+            'records': [{'id': 7, 'fields': {'uuid': self.fields['uuid'], 'response_status': 'active'}}],
+            'loaded_at': app.time.monotonic(),
+        }
+        current = {'id': 7, 'fields': {
+            'uuid': self.fields['uuid'],
+            'response_status': 'disabled',
+            'response_disabled_by': 'admin@example.org',
+        }}
+        fetch_record_by_field.return_value = (current, Mock(status_code=200))
+        write_grist_records.return_value = Mock(status_code=200)
+        fields = {**self.fields, 'flow_role': 'candidate'}
+        columns = set(fields) | app.EURES_RESPONSE_ADMIN_FIELDS
+        with patch.object(app, 'get_table_columns', return_value=columns):
+            response = self.client.post('/api/forms/eures-beta/record', json={'fields': fields})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['action'], 'updated')
+        self.assertEqual(fetch_record_by_field.call_count, 2)
+        patched_fields = write_grist_records.call_args.args[2]['records'][0]['fields']
+        self.assertEqual(patched_fields['response_status'], 'disabled')
+        self.assertEqual(patched_fields['response_disabled_by'], 'admin@example.org')
+
     @patch.object(app.requests, 'Session')
     def test_grist_write_redirect_keeps_method_and_redirect_cookie_session(self, session_factory):
         session = session_factory.return_value.__enter__.return_value
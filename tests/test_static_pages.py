@@ -0,0 +1,49 @@
+import unittest
+
+import app
+
+
+class StaticPagesTest(unittest.TestCase):
+    def setUp(self):
+        self.client = app.app.test_client()
+
+    def test_form_page_is_served_from_memory_with_etag(self):
+        response = self.client.get('/forms/fagerh/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, (app.FORMS_DIR / 'fagerh' / 'index.html').read_bytes())
+        self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+        etag = response.headers['ETag']
+
+        revalidated = self.client.get('/forms/fagerh/', headers={'If-None-Match': etag})
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_unknown_form_page_returns_404(self):
+        response = self.client.get('/forms/does-not-exist/')
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_assets_are_cached_for_a_bounded_time(self):
+        response = self.client.get('/assets/grist-form.js')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.cache_control.max_age, app.STATIC_ASSETS_MAX_AGE_SECONDS)
+        self.assertTrue(response.cache_control.public)
+        response.close()
+
+    def test_form_files_are_cached_and_pages_revalidated(self):
+        script = self.client.get('/forms/eures-beta/app.js')
+        page = self.client.get('/forms/fagerh/wizard_v3')
+
+        self.assertEqual(script.status_code, 200)
+        self.assertEqual(script.cache_control.max_age, app.STATIC_ASSETS_MAX_AGE_SECONDS)
+        self.assertTrue(script.cache_control.public)
+        self.assertEqual(page.status_code, 200)
+        self.assertTrue(page.cache_control.no_cache)
+        self.assertIsNotNone(page.headers.get('ETag'))
+        script.close()
+        page.close()
+
+
+if __name__ == '__main__':
+    unittest.main()